@@ -7,8 +7,9 @@ from logging import getLogger
 
 import pyjexl
 from pyjexl.analysis import JEXLAnalyzer, ValidatingAnalyzer
-from pyjexl.exceptions import ParseError
-from pyjexl.parser import ArrayLiteral, Literal, ObjectLiteral
+from pyjexl.evaluator import Context
+from pyjexl.exceptions import MissingTransformError, ParseError
+from pyjexl.parser import ArrayLiteral, Literal, ObjectLiteral, jexl_grammar
 from rest_framework import exceptions
 
 log = getLogger(__name__)
@@ -54,6 +55,142 @@ class Cache:
             del self._mru[key]
 
 
+class JEXLCompiler:
+    """Compile parsed JEXL expressions into nested python closures.
+
+    The returned callable takes the evaluation context and the transforms to
+    use and mirrors `pyjexl.evaluator.Evaluator`, including its quirks (e.g.
+    transform arguments are evaluated in an empty context). The difference is
+    that dispatching on the node types happens once per expression instead of
+    on every evaluation.
+
+    Note: Operators are bound at compile time, and the compiled expressions
+    are cached across all JEXL instances. Operators must therefore not
+    reference any instance state. Transforms are looked up at evaluation
+    time, so they may.
+    """
+
+    def compile(self, expression):
+        compiled = self.visit(expression)
+
+        def evaluate(context, transforms):
+            return compiled(context or Context(), transforms)
+
+        return evaluate
+
+    def visit(self, expression):
+        method = getattr(self, f"visit_{type(expression).__name__}", self.generic_visit)
+        return method(expression)
+
+    def visit_BinaryExpression(self, exp):
+        func = exp.operator.evaluate
+        left = self.visit(exp.left)
+        right = self.visit(exp.right)
+
+        if exp.operator._evaluate_lazy:
+            return lambda context, transforms: func(
+                lambda: left(context, transforms), lambda: right(context, transforms)
+            )
+        return lambda context, transforms: func(
+            left(context, transforms), right(context, transforms)
+        )
+
+    def visit_UnaryExpression(self, exp):
+        func = exp.operator.evaluate
+        right = self.visit(exp.right)
+
+        if exp.operator._evaluate_lazy:
+            return lambda context, transforms: func(lambda: right(context, transforms))
+        return lambda context, transforms: func(right(context, transforms))
+
+    def visit_Literal(self, literal):
+        value = literal.value
+        return lambda context, transforms: value
+
+    def visit_Identifier(self, identifier):
+        name = identifier.value
+
+        if identifier.relative:
+            return lambda context, transforms: context.relative_value.get(name, None)
+        elif identifier.subject:
+            subject = self.visit(identifier.subject)
+            return lambda context, transforms: subject(context, transforms).get(
+                name, None
+            )
+        return lambda context, transforms: context.get(name, None)
+
+    def visit_ObjectLiteral(self, object_literal):
+        items = [
+            (key, self.visit(value)) for key, value in object_literal.value.items()
+        ]
+        return lambda context, transforms: {
+            key: value(context, transforms) for key, value in items
+        }
+
+    def visit_ArrayLiteral(self, array_literal):
+        values = [self.visit(value) for value in array_literal.value]
+        return lambda context, transforms: [
+            value(context, transforms) for value in values
+        ]
+
+    def visit_Transform(self, transform):
+        name = transform.name
+        subject = self.visit(transform.subject)
+        args = [self.visit(arg) for arg in transform.args]
+
+        def _transform(context, transforms):
+            try:
+                transform_func = transforms[name]
+            except KeyError:
+                raise MissingTransformError(
+                    f'No transform found with the name "{name}"'
+                )
+
+            evaluated_args = [arg(Context(), transforms) for arg in args]
+            return transform_func(subject(context, transforms), *evaluated_args)
+
+        return _transform
+
+    def visit_FilterExpression(self, filter_expression):
+        subject = self.visit(filter_expression.subject)
+        expression = self.visit(filter_expression.expression)
+
+        if filter_expression.relative:
+            return lambda context, transforms: [
+                value
+                for value in subject(context, transforms)
+                if expression(context.with_relative(value) or Context(), transforms)
+            ]
+
+        def _filter(context, transforms):
+            values = subject(context, transforms)
+            filter_value = expression(context, transforms)
+            if filter_value is True:
+                return values
+            elif filter_value is False:
+                return None
+            try:
+                return values[filter_value]
+            except (IndexError, KeyError):
+                return None
+
+        return _filter
+
+    def visit_ConditionalExpression(self, conditional):
+        test = self.visit(conditional.test)
+        consequent = self.visit(conditional.consequent)
+        alternate = self.visit(conditional.alternate)
+
+        return lambda context, transforms: (
+            consequent(context, transforms)
+            if test(context, transforms)
+            else alternate(context, transforms)
+        )
+
+    def generic_visit(self, expression):
+        raise ValueError(f"Could not evaluate expression: {expression!r}")
+
+
 class JexlValidator(object):
     def __init__(self, jexl):
         self.jexl = jexl
@@ -66,6 +203,8 @@ class JexlValidator(object):
 
 class JEXL(pyjexl.JEXL):
     expr_cache = Cache()
+    compiled_cache = Cache()
+    grammar_cache = {}
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -76,9 +215,7 @@ class JEXL(pyjexl.JEXL):
         self.add_transform("stringify", lambda obj: json.dumps(obj))
         self.add_transform("flatten", self._flatten_transform)
         self.add_transform("length", self._length_transform)
-        self.add_binary_operator(
-            "intersects", 20, lambda left, right: any(x in right for x in left)
-        )
+        self.add_binary_operator("intersects", 20, self._intersects_operator)
 
         def _handle_error(func, subject, *args):
             try:
@@ -118,10 +255,36 @@ class JEXL(pyjexl.JEXL):
             ),
         )
 
+    @staticmethod
+    def _intersects_operator(left, right):
+        if isinstance(right, (list, tuple)):
+            try:
+                return not set(right).isdisjoint(left)
+            except TypeError:
+                # unhashable values (e.g. nested lists), fall back to comparing
+                # each value
+                pass
+
+        return any(x in right for x in left)
+
     def _round_compat(self, num, ndigits=0):
         power = 10**ndigits
         return float(math.floor((num * power) + 0.5) / power)
 
+    @property
+    def grammar(self):
+        # Building the grammar is expensive and it only depends on the
+        # operator symbols, so share it between all instances
+        if not self._grammar:
+            key = (
+                frozenset(self.config.unary_operators),
+                frozenset(self.config.binary_operators),
+            )
+            if key not in self.grammar_cache:
+                self.grammar_cache[key] = jexl_grammar(self.config)
+            self._grammar = self.grammar_cache[key]
+        return self._grammar
+
     def parse(self, expression):
         parsed_expression = self.expr_cache.get_or_set(
             expression, lambda: super(JEXL, self).parse(expression)
@@ -169,7 +332,11 @@ class JEXL(pyjexl.JEXL):
     def evaluate(self, expression, context=None):
         self._expr_stack.append(expression)
         try:
-            return super().evaluate(expression, context)
+            compiled_expression = self.compiled_cache.get_or_set(
+                expression, lambda: JEXLCompiler().compile(self.parse(expression))
+            )
+            context = Context(context) if context is not None else self.context
+            return compiled_expression(context, self.config.transforms)
         finally:
             self._expr_stack.pop()
 
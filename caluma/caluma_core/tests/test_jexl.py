@@ -1,9 +1,17 @@
 import functools
+import gc
+import weakref
 
 import pyjexl
 import pytest
 
-from ..jexl import JEXL, Cache, CalumaAnalyzer, ExtractTransformSubjectAnalyzer
+from ..jexl import (
+    JEXL,
+    Cache,
+    CalumaAnalyzer,
+    ExtractTransformSubjectAnalyzer,
+    JEXLCompiler,
+)
 
 
 @pytest.mark.parametrize(
@@ -102,6 +110,89 @@ def test_jexl_cache():
     assert cache._cache.keys() == cache._mru.keys()
 
 
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "1 + 2 * 3",
+        "!(1 > 2) && 'a' in ['a', 'b'] || false",
+        "false && undefined_var.foo",
+        "foo.bar.baz",
+        "foo.missing",
+        "{ a: foo.bar, b: [1, 2] }",
+        "foo.list[.x > 1]",
+        "foo.list[1].x",
+        "foo.list[5]",
+        "foo.list[true]",
+        "foo.list[false]",
+        "foo.bar.baz == 'x' ? 'yes' : 'no'",
+        "foo.bar.baz|upper",
+        "[1, 2]|join('-')",
+        "[1, 2]|join(foo)",
+        "[1] intersects [1, 2]",
+    ],
+)
+@pytest.mark.parametrize("context", [None, {}, {"foo": {"bar": {"baz": "x"}}}])
+def test_jexl_compiler(expression, context):
+    if context:
+        context["foo"]["list"] = [{"x": 1}, {"x": 2}]
+
+    jexl = JEXL()
+    jexl.add_transform("upper", lambda value: value and value.upper())
+    jexl.add_transform("join", lambda value, sep: sep.join(map(str, value)))
+
+    def _result(func, *args):
+        try:
+            return func(*args)
+        except Exception as exc:
+            return type(exc)
+
+    expected = _result(
+        pyjexl.evaluator.Evaluator(jexl.config).evaluate,
+        jexl.parse(expression),
+        pyjexl.evaluator.Context(context),
+    )
+    assert _result(jexl.evaluate, expression, context) == expected
+
+
+def test_jexl_compiler_lazy_unary_operator():
+    jexl = JEXL()
+    jexl.config.unary_operators["~"] = pyjexl.operators.Operator(
+        "~", 1000, lambda right: not right(), evaluate_lazy=True
+    )
+
+    assert jexl.evaluate("~(1 > 2)") is True
+
+
+def test_jexl_compiler_errors():
+    jexl = JEXL()
+
+    with pytest.raises(pyjexl.exceptions.MissingTransformError):
+        jexl.evaluate("1|unknown")
+
+    with pytest.raises(ValueError):
+        JEXLCompiler().compile(object())
+
+
+def test_intersects_operator_does_not_retain_instance():
+    jexl = JEXL(context={"foo": "bar"})
+    assert jexl.evaluate("[1] intersects [1, 2]")
+
+    ref = weakref.ref(jexl)
+    del jexl
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_jexl_grammar_cache():
+    jexl = JEXL()
+    assert jexl.grammar is JEXL().grammar
+
+    jexl.add_binary_operator("foo", 20, lambda left, right: left)
+    assert jexl.grammar is not JEXL().grammar
+    assert jexl.evaluate("1 foo 2") == 1
+
+
 @pytest.mark.parametrize(
     "expression,result",
     [
@@ -127,6 +218,9 @@ def test_mapby_operator(expression, result):
         ("['foo'] intersects ['foo', 'foo']", True),
         ("[1] intersects [1] && [2] intersects [2]", True),
         ("[2] intersects [1] + [2]", True),
+        ("[[1]] intersects [[1], [2]]", True),
+        ("[[3]] intersects [[1], [2]]", False),
+        ("['fo'] intersects 'foo'", True),
     ],
 )
 def test_intersects_operator(expression, result):
@@ -1,3 +1,4 @@
+import json
 import logging
 from typing import Tuple
 
@@ -6,6 +7,63 @@ from caluma.utils import is_iterable_and_no_string
 
 logger = logging.getLogger(__name__)
 
+_SCALAR_TYPES = {str, int, float}
+_SEQUENCE_TYPES = {list, tuple}
+
+
+def _index_strings(data):
+    # Slugs are strings already, no `str()` needed for the keys
+    return dict(zip(data, data))
+
+
+def _index_scalars(data):
+    return {str(slug): slug for slug in data}
+
+
+def _index_singletons(data):
+    return {str(slug): slug for (slug,) in data}
+
+
+def _index_pairs(data):
+    return {str(slug): label for slug, label in data}
+
+
+def _index_mixed(data):
+    index = {}
+    for slug in data:
+        label = slug
+        if is_iterable_and_no_string(slug):
+            label = slug[-1]
+            slug = slug[0]
+        index[str(slug)] = label
+    return index
+
+
+def _build_slug_index(data):
+    """Build a slug -> label dict from the output of `get_data()`.
+
+    Data sources almost always return options of one single shape, so we
+    detect the shape once and use a loop specialised for it, instead of
+    inspecting every option. Anything else takes the generic path.
+
+    The data is indexed in reverse, so the first option wins if multiple
+    options share a slug.
+    """
+    data = data[::-1]
+    types = set(map(type, data))
+
+    if types == {str}:
+        return _index_strings(data)
+    if types <= _SCALAR_TYPES:
+        return _index_scalars(data)
+    if types <= _SEQUENCE_TYPES:
+        lengths = set(map(len, data))
+        if lengths == {1}:
+            return _index_singletons(data)
+        if lengths == {2}:
+            return _index_pairs(data)
+    return _index_mixed(data)
+
 
 class BaseDataSource:
     """Basic data source class to be extended by any data source implementation.
@@ -18,7 +76,8 @@ class BaseDataSource:
     The `validate_answer_value`-method checks if each value in
     `self.get_data(user, question, context)` equals the value of the parameter
     `value`. If this is correct the method returns the label as a String and
-    otherwise the method returns `False`.
+    otherwise the method returns `False`. `validate_answer_values` does the same
+    for a list of values at once, returning a dict of value -> label.
 
     Examples:
         [['my-option', {"en": "english description", "de": "deutsche Beschreibung"}, ...]
@@ -58,30 +117,99 @@ class BaseDataSource:
     def get_data(self, user, question, context):  # pragma: no cover
         raise NotImplementedError()
 
+    def _cache_key(self, user, question, context):
+        return (
+            id(user),
+            getattr(question, "pk", None),
+            json.dumps(context, sort_keys=True, default=str),
+        )
+
+    def _get_data_cached(self, user, question, context):
+        """Return the result of `get_data()`, memoised on this instance.
+
+        Validating multiple values against the same data source instance (for
+        example the values of a dynamic multiple choice answer) then only
+        calls `get_data()` once, instead of once per value.
+        """
+        if not hasattr(self, "_data_cache"):
+            # set lazily, as subclasses may not call `super().__init__()`
+            self._data_cache = {}
+
+        key = self._cache_key(user, question, context)
+        if key not in self._data_cache:
+            self._data_cache[key] = self.get_data(user, question, context)
+        return self._data_cache[key]
+
+    def _slug_index(self, user, question, context):
+        """Return a dict mapping each option's slug (as string) to its label.
+
+        The index is built once per instance and arguments, so validating
+        values becomes a dict lookup instead of a scan over `get_data()`.
+        If multiple options share a slug, the first one wins.
+        """
+        if not hasattr(self, "_slug_index_cache"):
+            self._slug_index_cache = {}
+
+        key = self._cache_key(user, question, context)
+        if key not in self._slug_index_cache:
+            self._slug_index_cache[key] = _build_slug_index(
+                list(self._get_data_cached(user, question, context))
+            )
+        return self._slug_index_cache[key]
+
     def validate_answer_value(self, value, document, question, user, context):
-        for data in self.get_data(user, question, context):
-            label = data
-            if is_iterable_and_no_string(data):
-                label = data[-1]
-                data = data[0]
-            if str(data) == value:
+        return self._validate_answer_values([value], document, question, user, context)[
+            value
+        ]
+
+    def validate_answer_values(self, values, document, question, user, context):
+        """Validate multiple answer values at once.
+
+        Return a dict mapping each value to its label, or to `False` if the
+        value is not valid. Values missing from `get_data()` are looked up in
+        the document's dynamic options using a single query.
+        """
+        if type(self).validate_answer_value is not BaseDataSource.validate_answer_value:
+            # Custom single value validation must be honored
+            return {
+                value: self.validate_answer_value(
+                    value, document, question, user, context
+                )
+                for value in values
+            }
+
+        return self._validate_answer_values(values, document, question, user, context)
+
+    def _validate_answer_values(self, values, document, question, user, context):
+        index = self._slug_index(user, question, context)
+        labels = {}
+        missing = []
+        for value in values:
+            if value in index:
+                label = index[value]
                 if not isinstance(label, dict):
                     label = str(label)
-                return label
-        dynamic_option = DynamicOption.objects.filter(
-            document=document, question=question, slug=value
-        ).first()
-        if dynamic_option:
-            return dynamic_option.label
-        return False
+                labels[value] = label
+            else:
+                labels[value] = False
+                missing.append(value)
+
+        if missing:
+            labels.update(
+                DynamicOption.objects.filter(
+                    document=document, question=question, slug__in=missing
+                ).values_list("slug", "label")
+            )
+        return labels
 
     def try_get_data_with_fallback(self, user, question, context):
         try:
-            new_data = self.get_data(user, question, context)
+            new_data = self._get_data_cached(user, question, context)
         except Exception as e:
             logger.exception(
-                f"Executing {type(self).__name__}.get_data() failed:"
-                f"{e}\n Using default data."
+                "Executing %s.get_data() failed:%s\n Using default data.",
+                type(self).__name__,
+                e,
             )
             if self.default is None:
                 raise e
@@ -43,6 +43,12 @@ class MyOtherDataSource(MyDataSource):
         return "Test 123"
 
 
+class MyExtendingDataSource(MyDataSource):
+    def validate_answer_value(self, value, document, question, info, context):
+        label = super().validate_answer_value(value, document, question, info, context)
+        return label.upper() if isinstance(label, str) else label
+
+
 class MyFaultyDataSource(BaseDataSource):
     info = "Faulty test data source"
     default = None
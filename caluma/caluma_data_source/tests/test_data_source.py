@@ -7,6 +7,9 @@ from django.utils import translation
 from caluma.caluma_form.models import DynamicOption, Question
 from caluma.caluma_user.models import BaseUser
 
+from ..data_sources import _build_slug_index
+from .data_sources import MyDataSource, MyExtendingDataSource
+
 
 def test_fetch_data_sources(snapshot, schema_executor, settings):
     settings.DATA_SOURCE_CLASSES = [
@@ -295,3 +298,106 @@ def test_data_source_context(
     result = schema_executor(query, variable_values=variables)
     assert not result.errors
     snapshot.assert_match(result.data)
+
+
+def test_validate_answer_value_fetches_data_once(db, info, document, question, mocker):
+    data_source = MyDataSource()
+    get_data = mocker.spy(data_source, "get_data")
+
+    for value in ["1", "sdkj", "value", "not in data"]:
+        data_source.validate_answer_value(
+            value, document, question, info.context.user, None
+        )
+
+    assert get_data.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("1", "1"),
+        ("5.5", "5.5"),
+        ("sdkj", "sdkj"),
+        ("value", "info"),
+        ("something", "something"),
+        (
+            "translated_value",
+            {"en": "english description", "de": "deutsche Beschreibung"},
+        ),
+        ("info", False),
+        ("not in data", False),
+    ],
+)
+def test_validate_answer_value_label(db, info, document, question, value, expected):
+    data_source = MyDataSource()
+    label = data_source.validate_answer_value(
+        value, document, question, info.context.user, None
+    )
+    assert label == expected
+
+
+def test_validate_answer_values(
+    db,
+    info,
+    document,
+    question,
+    dynamic_option_factory,
+    django_assert_num_queries,
+):
+    dynamic_option_factory(
+        document=document, question=question, slug="old-1", label="Old 1"
+    )
+    dynamic_option_factory(
+        document=document, question=question, slug="old-2", label="Old 2"
+    )
+
+    with django_assert_num_queries(1):
+        labels = MyDataSource().validate_answer_values(
+            ["sdkj", "old-1", "old-2", "not in data"],
+            document,
+            question,
+            info.context.user,
+            None,
+        )
+
+    assert labels == {
+        "sdkj": "sdkj",
+        "old-1": "Old 1",
+        "old-2": "Old 2",
+        "not in data": False,
+    }
+
+
+def test_validate_answer_values_extending_super(db, info, document, question):
+    labels = MyExtendingDataSource().validate_answer_values(
+        ["sdkj", "value", "not in data"],
+        document,
+        question,
+        info.context.user,
+        None,
+    )
+
+    assert labels == {"sdkj": "SDKJ", "value": "INFO", "not in data": False}
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ([], {}),
+        (["a", "b", "a"], {"a": "a", "b": "b"}),
+        ([1, "a", 2.5], {"1": 1, "a": "a", "2.5": 2.5}),
+        ([["a"], ("b",)], {"a": "a", "b": "b"}),
+        ([["a", "A"], ("b", {"en": "B"})], {"a": "A", "b": {"en": "B"}}),
+        ([["a", "first"], ["a", "second"]], {"a": "first"}),
+        (
+            [1, ["a"], ("b", "B"), ["c", "x", "C"]],
+            {"1": 1, "a": "a", "b": "B", "c": "C"},
+        ),
+    ],
+)
+def test_build_slug_index(data, expected):
+    assert _build_slug_index(data) == expected
+
+
+def test_default_on_copy():
+    assert MyDataSource().on_copy(None, None, ("slug", "Label")) == ("slug", "Label")
@@ -198,6 +198,20 @@ class AnswerFactory(DjangoModelFactory):
                 )
             self.save()
 
+    @classmethod
+    def create_bulk(cls, document, values):
+        """Create answers for the given `{question: value}` mapping in one query.
+
+        As `bulk_create()` is used, no signals are sent and no history is
+        recorded. Only use this where neither is needed.
+        """
+        return models.Answer.objects.bulk_create(
+            [
+                cls.build(document=document, question=question, value=value)
+                for question, value in values.items()
+            ]
+        )
+
     class Meta:
         model = models.Answer
         skip_postgeneration_save = True
@@ -449,6 +449,8 @@ class Document(core_models.UUIDModel):
         and update the dynamic options of the answers through the data source on_copy
         method.
         """
+        # deferred import to avoid circular dependency
+        from caluma.caluma_data_source.data_sources import BaseDataSource
 
         # get all dynamic answers of the document family
         family_dynamic_answers = Answer.objects.filter(
@@ -468,17 +470,22 @@ class Document(core_models.UUIDModel):
             data_source_class = get_data_sources(dic=True)[
                 new_answer.question.data_source
             ]
+            if data_source_class.on_copy is BaseDataSource.on_copy:
+                # The default implementation retains all dynamic options as
+                # they are, so there is nothing to do for this answer
+                continue
+
             data_source = data_source_class()
 
+            # get the old answer from the source document for comparison
+            old_answer = Answer.objects.get(
+                document=new_answer.document.source,
+                question=new_answer.question,
+            )
+
             for new_dynamic_option in DynamicOption.objects.filter(
                 document=new_answer.document, question=new_answer.question
             ):
-                # get the old answer from the source document for comparison
-                old_answer = Answer.objects.get(
-                    document=new_answer.document.source,
-                    question=new_answer.question,
-                )
-
                 # let the data source decide what to do with the answer value.
                 new_slug, new_label = data_source.on_copy(
                     old_answer=old_answer,
@@ -68,8 +68,15 @@ def object_local_memoise(method):
         if not hasattr(self, "_memoise"):
             clear_memoise(self)
 
-        key = str([args, kwargs, method])
-        if key in self._memoise:
+        key = (method, args, tuple(kwargs.items()))
+        try:
+            hit = key in self._memoise
+        except TypeError:
+            # unhashable arguments, fall back to their string representation
+            key = str([args, kwargs, method])
+            hit = key in self._memoise
+
+        if hit:
             object_local_memoise.hit_count += 1
             self._memoise_hit_count += 1
             return self._memoise[key]
@@ -164,6 +171,8 @@ class FastLoader:
         self._jexl_dependencies: dict[str, dict[str, str]] = defaultdict(
             lambda: defaultdict(list)
         )
+        # The same graph in "forward" direction: question -> referenced questions
+        self._jexl_references: dict[str, set[str]] = defaultdict(set)
 
     def _store_question(self, question):
         self._questions[question.pk] = question
@@ -186,6 +195,7 @@ class FastLoader:
                 self._jexl_dependencies[dependency_slug][question.pk].append(
                     expr_property
                 )
+            self._jexl_references[question.pk].update(referenced_questions)
 
     def dependents_of_question(self, slug):
         """Return the dependents of the given question.
@@ -201,6 +211,15 @@ class FastLoader:
         """
         return self._jexl_dependencies[slug]
 
+    def references_of_question(self, slug):
+        """Return the questions referenced in the given question's expressions.
+
+        This is the reverse of `dependents_of_question()`: If `question-a`
+        mentions `question-b` in it's `is_hidden` expression, then
+        `question-b` is in `references_of_question('question-a')`.
+        """
+        return self._jexl_references[slug]
+
     def _load_form_entities(self, known_forms):
         form_questions = (
             FormQuestion.objects.filter(form__in=known_forms)
@@ -475,6 +494,11 @@ class BaseField(ABC):
         Note: If there are no dependencies, we return False. Question slugs
         referring to missing fields are ignored.
         """
+        if expr in ("true", "false"):
+            # Constant expressions can't have any dependencies, no need to
+            # build up an evaluator to analyze them
+            return False
+
         dependencies = list(self.get_evaluator().extract_referenced_questions(expr))
         dep_fields = {
             dep: self.get_field(dep) for dep in dependencies if self.get_field(dep)
@@ -686,7 +710,7 @@ class ValueField(BaseField):
             not bool(
                 (self.answer.value not in (*self.EMPTY_VALUES, ""))
                 or (is_date and self.answer.date is not None)
-                or (is_files and self.answer.files.exists())
+                or (is_files and self._fastloader.files_for_answer(self.answer.pk))
             )
             # Being hidden makes you empty even if an answer exists
             or self.is_hidden()
@@ -711,11 +735,15 @@ class FieldSet(BaseField):
         question=None,
         global_context=None,
         _fastloader=None,
+        _question_slugs=None,
     ):
         # TODO: prefetch document once we have the structure built up
         #
         self.question = question
         self._document = document
+        # If given, only the fields of those questions are built. See
+        # `build_partial_fieldset()`
+        self._question_slugs = _question_slugs
 
         self._fastloader = _fastloader or self._make_fastloader(document)
         self.form = form or self._fastloader.form_by_id(document.form_id)
@@ -832,6 +860,12 @@ class FieldSet(BaseField):
         questions = self._fastloader.questions_for_form(self.form.pk)
 
         for question in questions:
+            if (
+                self._question_slugs is not None
+                and question.slug not in self._question_slugs
+            ):
+                continue
+
             if question.type == Question.TYPE_FORM:
                 self._context[question.slug] = FieldSet(
                     document=self._document,
@@ -840,6 +874,7 @@ class FieldSet(BaseField):
                     question=question,
                     global_context=self.get_global_context(),
                     _fastloader=self._fastloader,
+                    _question_slugs=self._question_slugs,
                 )
             elif question.type == Question.TYPE_TABLE:
                 self._context[question.slug] = RowSet(
@@ -847,6 +882,7 @@ class FieldSet(BaseField):
                     answer=answers_by_q_slug.get(question.slug),
                     parent=self,
                     _fastloader=self._fastloader,
+                    _question_slugs=self._question_slugs,
                 )
             else:
                 # "leaf" question
@@ -888,7 +924,12 @@ class RowSet(BaseField):
     rows: list[FieldSet]
 
     def __init__(
-        self, question, parent, answer: Optional[Answer] = None, _fastloader=None
+        self,
+        question,
+        parent,
+        answer: Optional[Answer] = None,
+        _fastloader=None,
+        _question_slugs=None,
     ):
         self.question = question
         self.answer = answer
@@ -912,6 +953,7 @@ class RowSet(BaseField):
                     parent=self,
                     global_context=self.get_global_context(),
                     _fastloader=self._fastloader,
+                    _question_slugs=_question_slugs,
                 )
                 for row_doc in self._fastloader.rows_for_table_answer(answer.pk)
             ]
@@ -970,6 +1012,58 @@ class RowSet(BaseField):
         return f"RowSet(q={self.question.slug}, f={self.form.slug})"
 
 
+def build_partial_fieldset(document, required_slugs: Iterable[str]) -> FieldSet:
+    """Build a document's structure, limited to the given questions.
+
+    Only the fields needed to evaluate the state (hidden, required, value)
+    of the given questions are built: The questions themselves, the form and
+    table questions they're nested in, and everything their JEXL expressions
+    reference, recursively. Form and table questions that are referenced or
+    given bring along all their children, as their value depends on them.
+
+    Intended for cases where only a few fields are of interest. The
+    resulting structure is *not* suited for validating the whole document.
+    """
+    fastloader = FastLoader.for_document(document)
+
+    # Collect the form and table questions each question is nested in, and
+    # the reverse: all questions nested below each form and table question
+    containers = defaultdict(set)
+    nested = defaultdict(set)
+
+    def collect(form_id, path):
+        for question in fastloader.questions_for_form(form_id):
+            containers[question.slug].update(path)
+            for container in path:
+                nested[container].add(question.slug)
+
+            if question.type in (Question.TYPE_FORM, Question.TYPE_TABLE):
+                sub_form_id = question.sub_form_id or question.row_form_id
+                collect(sub_form_id, (*path, question.slug))
+
+    collect(document.form_id, ())
+
+    # Walk the dependencies. Form and table questions that are only needed
+    # because they contain a question don't need all their other children
+    visited = set()
+    to_visit = [(slug, True) for slug in required_slugs]
+    while to_visit:
+        slug, with_nested = node = to_visit.pop()
+        if node in visited or slug not in containers:
+            continue
+        visited.add(node)
+
+        to_visit.extend((container, False) for container in containers[slug])
+        to_visit.extend(
+            (reference, True) for reference in fastloader.references_of_question(slug)
+        )
+        if with_nested:
+            to_visit.extend((nested_slug, True) for nested_slug in nested[slug])
+
+    question_slugs = {slug for slug, _ in visited}
+    return FieldSet(document, _fastloader=fastloader, _question_slugs=question_slugs)
+
+
 def print_structure(fieldset: FieldSet, print_fn=None, method=str):
     """Print a document's structure.
 
@@ -1008,6 +1102,37 @@ def print_structure(fieldset: FieldSet, print_fn=None, method=str):
     visit(fieldset)
 
 
+def tree_signature(fieldset: FieldSet) -> tuple:
+    """Return the given fieldset's structure as nested tuples.
+
+    Each field is represented as a tuple of its type name, question slug and
+    either its value (for value fields) or its form slug and children (for
+    fieldsets and rowsets). In contrast to `list_structure()`, nothing is
+    rendered to text, which makes this cheap to compare.
+    """
+
+    @singledispatch
+    def visit(vis):  # pragma: no cover
+        # Should never happen - for completeness only
+        raise Exception(f"generic visit(): {vis}")
+
+    @visit.register(FieldSet)
+    @visit.register(RowSet)
+    def _(vis):
+        return (
+            type(vis).__name__,
+            vis.slug(),
+            vis.form.slug,
+            tuple(visit(sub) for sub in vis.children()),
+        )
+
+    @visit.register(ValueField)
+    def _(vis):
+        return ("ValueField", vis.slug(), vis.get_value())
+
+    return visit(fieldset)
+
+
 def list_structure(fieldset, method=str):
     """List the given fieldset's structure.
 
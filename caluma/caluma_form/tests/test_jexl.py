@@ -1,9 +1,10 @@
 import gc
-import itertools
+import os
 from collections import Counter
 from contextlib import nullcontext as does_not_raise
 
 import pytest
+from django.db import transaction
 
 from .. import models, structure, validators
 from ..jexl import QuestionJexl, QuestionMissing
@@ -71,7 +72,7 @@ def test_all_deps_hidden(db, form, document_factory, form_question_factory):
     ).question
     document = document_factory(form=form)
 
-    struc = structure.FieldSet(document)
+    struc = structure.build_partial_fieldset(document, [q2.slug])
     field = struc.get_field(q2.slug)
     # Q2 is dependent on Q1 for it's hidden and required properties.
     # Since Q1 is hidden, Q2 can't really evaluate both expressions.
@@ -160,8 +161,7 @@ def test_indirectly_hidden_dependency(
 
     # ... then build the document
     topdoc = document_factory(form=topform)
-    answer_factory(document=topdoc, question=subquestion1, value="blah")
-    answer_factory(document=topdoc, question=subquestion2, value="bluh")
+    answer_factory.create_bulk(topdoc, {subquestion1: "blah", subquestion2: "bluh"})
 
     validator = validators.DocumentValidator()
 
@@ -297,25 +297,23 @@ def test_new_jexl_expressions(
         except validators.CustomValidationError:
             return False
 
-    # The following few lines are just to generate a more useful assertion
-    # message in case the expectations are not met. They're not influencing
-    # the actual result
-    context = []
-    from caluma.caluma_form import structure
-
-    fieldset = structure.FieldSet(document)
-    structure.print_structure(
-        fieldset,
-        print_fn=lambda *x: context.append(" ".join([str(f) for f in x])),
-    )
-    ctx_str = "\n".join(context)
     result = do_check()
-    relevant_field = fieldset.find_all_fields_by_slug(question)[0]
-    assert result == expectation, (
-        f"Expected JEXL({expr}) on question '{question}' to evaluate "
-        f"to {expectation} but got {result}; context was: \n{ctx_str};\n"
-        f"field-local `info` context: {relevant_field.get_local_info_context()}"
-    )
+    if result != expectation:  # pragma: no cover
+        # The following few lines are just to generate a more useful assertion
+        # message. They're only needed (and thus only built) on failure
+        context = []
+        fieldset = structure.FieldSet(document)
+        structure.print_structure(
+            fieldset,
+            print_fn=lambda *x: context.append(" ".join([str(f) for f in x])),
+        )
+        ctx_str = "\n".join(context)
+        relevant_field = fieldset.find_all_fields_by_slug(question)[0]
+        pytest.fail(
+            f"Expected JEXL({expr}) on question '{question}' to evaluate "
+            f"to {expectation} but got {result}; context was: \n{ctx_str};\n"
+            f"field-local `info` context: {relevant_field.get_local_info_context()}"
+        )
 
 
 def test_answer_transform_on_hidden_question(info, form_and_document):
@@ -356,15 +354,29 @@ def test_answer_transform_on_hidden_question(info, form_and_document):
 
     # We're just validating the assumptions here for better understanding of
     # the test situation
-    assert structure.list_document_structure(document, method=repr) == [
-        " FieldSet(q=(root), f=top_form)",
-        "    ValueField(q=top_question, v=xyz)",
-        "    RowSet(q=table, f=row_form)",
-        "       FieldSet(q=table, f=row_form)",
-        "          ValueField(q=column, v=None)",  # this is our test field
-        "    FieldSet(q=form, f=sub_form)",
-        "       ValueField(q=sub_question, v=None)",
-    ]
+    assert structure.tree_signature(structure.FieldSet(document)) == (
+        "FieldSet",
+        None,
+        "top_form",
+        (
+            ("ValueField", "top_question", "xyz"),
+            (
+                "RowSet",
+                "table",
+                "row_form",
+                (
+                    (
+                        "FieldSet",
+                        "table",
+                        "row_form",
+                        # this is our test field
+                        (("ValueField", "column", None),),
+                    ),
+                ),
+            ),
+            ("FieldSet", "form", "sub_form", (("ValueField", "sub_question", None),)),
+        ),
+    )
 
     validator = validators.DocumentValidator()
     with pytest.raises(validators.CustomValidationError):
@@ -378,32 +390,11 @@ def test_answer_transform_on_hidden_question(info, form_and_document):
     assert validator.validate(document, info) is None
 
 
-@pytest.mark.parametrize(
-    "question_type,expected_value",
-    [
-        (Question.TYPE_MULTIPLE_CHOICE, []),
-        (Question.TYPE_INTEGER, None),
-        (Question.TYPE_FLOAT, None),
-        (Question.TYPE_DATE, None),
-        (Question.TYPE_CHOICE, None),
-        (Question.TYPE_TEXTAREA, None),
-        (Question.TYPE_TEXT, None),
-        (Question.TYPE_TABLE, []),
-        (Question.TYPE_FILES, None),
-        (Question.TYPE_DYNAMIC_CHOICE, None),
-        (Question.TYPE_DYNAMIC_MULTIPLE_CHOICE, []),
-        # Those should not appear in a JEXL answer transform
-        # (Question.TYPE_FORM,None),
-        # (Question.TYPE_STATIC,None),
-    ],
-)
 def test_answer_transform_on_hidden_question_types(
     info,
     form_and_document,
     document_factory,
     answer_factory,
-    question_type,
-    expected_value,
     form_factory,
 ):
     form, document, questions, answers = form_and_document(
@@ -415,24 +406,47 @@ def test_answer_transform_on_hidden_question_types(
     answer_factory(document=row_doc, question=questions["column"])
     answers["table"].documents.add(row_doc)
 
-    questions["form"].is_hidden = (
-        f"'top_question'|answer == {expected_value}"
-        " && 'table'|answer|mapby('column')[0]"
-        " && 'table'|answer|mapby('column')[1]"
-    )
-    questions["form"].save()
-
-    questions["top_question"].is_hidden = "true"
-    questions["top_question"].type = question_type
-    questions["top_question"].row_form = (
-        form_factory() if question_type == Question.TYPE_TABLE else None
-    )
-    questions["top_question"].save()
-
-    struc = structure.FieldSet(document)
-    field = struc.get_field("form")
-
-    assert field.is_hidden()
+    # The form & document setup above is shared between all question types.
+    # Each type is checked within a savepoint that is rolled back afterwards,
+    # so no changes leak into the next one.
+    for question_type, expected_value in [
+        (Question.TYPE_MULTIPLE_CHOICE, []),
+        (Question.TYPE_INTEGER, None),
+        (Question.TYPE_FLOAT, None),
+        (Question.TYPE_DATE, None),
+        (Question.TYPE_CHOICE, None),
+        (Question.TYPE_TEXTAREA, None),
+        (Question.TYPE_TEXT, None),
+        (Question.TYPE_TABLE, []),
+        (Question.TYPE_FILES, None),
+        (Question.TYPE_DYNAMIC_CHOICE, None),
+        (Question.TYPE_DYNAMIC_MULTIPLE_CHOICE, []),
+        # Those should not appear in a JEXL answer transform
+        # (Question.TYPE_FORM,None),
+        # (Question.TYPE_STATIC,None),
+    ]:
+        with transaction.atomic():
+            questions["form"].is_hidden = (
+                f"'top_question'|answer == {expected_value}"
+                " && 'table'|answer|mapby('column')[0]"
+                " && 'table'|answer|mapby('column')[1]"
+            )
+            questions["top_question"].is_hidden = "true"
+            questions["top_question"].type = question_type
+            questions["top_question"].row_form = (
+                form_factory() if question_type == Question.TYPE_TABLE else None
+            )
+            Question.objects.bulk_update(
+                [questions["form"], questions["top_question"]],
+                fields=["is_hidden", "type", "row_form"],
+            )
+
+            struc = structure.build_partial_fieldset(document, ["form"])
+            field = struc.get_field("form")
+
+            assert field.is_hidden(), f"Failed for question type {question_type}"
+
+            transaction.set_rollback(True)
 
 
 @pytest.mark.parametrize(
@@ -581,7 +595,7 @@ def test_is_hidden_neighboring_table(
         form=form, question__type=Question.TYPE_FORM, question__sub_form=neighbor_form
     )
 
-    struc = structure.FieldSet(document)
+    struc = structure.build_partial_fieldset(document, [neighbor_sub_question.slug])
 
     field = struc.get_field(neighbor_sub_question.slug)
 
@@ -600,33 +614,31 @@ def test_optional_answer_transform(info, form_and_document):
     )
 
     questions["top_question"].is_hidden = "'nonexistent'|answer('default') == 'default'"
-    questions["top_question"].save()
+    questions["top_question"].save(update_fields=["is_hidden"])
 
     validator = validators.DocumentValidator()
     assert validator.validate(document, info) is None
 
     questions["top_question"].is_hidden = "'nonexistent'|answer(null) == null"
-    questions["top_question"].save()
+    questions["top_question"].save(update_fields=["is_hidden"])
 
     assert validator.validate(document, info) is None
 
     questions["top_question"].is_hidden = "'nonexistent'|answer == 'default'"
-    questions["top_question"].save()
+    questions["top_question"].save(update_fields=["is_hidden"])
 
     with pytest.raises(QuestionMissing):
         validator.validate(document, info)
 
 
 def _gc_object_counts_by_type():
-    # We sort, so the insertion order into the counter is something
-    # sorta-kinda useful. Otherwise, we'd get a random-ish insertion order
-    # that makes looking at the counter difficult (for humans)
-    o_types_sorted = sorted(
-        ((type(o).__module__, type(o).__qualname__) for o in gc.get_objects())
-    )
-    return Counter(o_types_sorted)
+    return Counter((type(o).__module__, type(o).__qualname__) for o in gc.get_objects())
 
 
+@pytest.mark.skipif(
+    bool(os.environ.get("CALUMA_SKIP_LEAK_CHECK")),
+    reason="Walking the whole heap is slow, skipped via CALUMA_SKIP_LEAK_CHECK",
+)
 def test_jexl2_memory_leaks(info, form_and_document):
     """Ensure our JEXL and form structures do not leak memory.
 
@@ -658,25 +670,18 @@ def test_jexl2_memory_leaks(info, form_and_document):
     stats_after = _gc_object_counts_by_type()
 
     # We are not concerned about django's or any other module's leaks,
-    # just our own
-    relevant_diffs = {}
-    for mod, cls in sorted(
-        set(itertools.chain(stats_before.keys(), stats_after.keys()))
-    ):
-        before = stats_before[mod, cls]
-        after = stats_after[mod, cls]
-        if mod.startswith("caluma"):
-            # Only look at caluma data. Graphene and Python interna are
-            # hard to keep track of (and not our responsibility to fix)
-            relevant_diffs[mod, cls] = (before, after)
-
-    # Should be empty
-    for (mod, cls), (before, after) in relevant_diffs.items():
-        leaked = after - before
-        assert leaked == 0, (
-            f"Leak detected: {mod}.{cls} was {before} before test run, "
-            f"but {after} afterwards (leaked {leaked} objects)"
-        )
+    # just our own. Graphene and Python interna are hard to keep track of
+    # (and not our responsibility to fix), so only look at caluma data.
+    # Counter subtraction only keeps types that grew, which are the leaks
+    leaks = {
+        (mod, cls): leaked
+        for (mod, cls), leaked in (stats_after - stats_before).items()
+        # `__module__` may be a descriptor on some C extension types
+        if isinstance(mod, str) and mod.startswith("caluma")
+    }
+
+    # Should be empty. Sorted, so the failure output is readable for humans
+    assert not leaks, f"Leaks detected (type: leaked objects): {sorted(leaks.items())}"
 
 
 @pytest.mark.parametrize(
@@ -476,3 +476,75 @@ def test_multistage_calculation_updates(
         "             Field(row_calc, 58.0)",
         "    Field(outer-calc, 192.5)",
     ]
+
+
+def test_object_local_memoise_unhashable_args():
+    class Memoised:
+        calls = 0
+
+        @structure.object_local_memoise
+        def length(self, value):
+            self.calls += 1
+            return len(value)
+
+    obj = Memoised()
+    assert obj.length(["a", "b"]) == 2
+    assert obj.length(["a", "b"]) == 2
+    assert obj.length(("a",)) == 1
+    assert obj.length(("a",)) == 1
+    assert obj.calls == 2
+
+
+@pytest.mark.parametrize(
+    "required_slugs,expected",
+    [
+        (
+            ["leaf1"],
+            [
+                " FieldSet(root)",
+                "    Field(leaf1, Some Value)",
+            ],
+        ),
+        (
+            # row_calc references leaf2 and row_field_2
+            ["row_calc"],
+            [
+                " FieldSet(root)",
+                "    Field(leaf2, 33)",
+                "    FieldSet(measure-evening)",
+                "       RowSet(too-wonder-option)",
+                "          FieldSet(too-wonder-option)",
+                "             Field(row_field_2, 99.5)",
+                "             Field(row_calc, None)",
+                "          FieldSet(too-wonder-option)",
+                "             Field(row_field_2, 23.0)",
+                "             Field(row_calc, None)",
+            ],
+        ),
+        (
+            # subform brings along everything below, including row_calc's
+            # reference to leaf2
+            ["subform"],
+            [
+                " FieldSet(root)",
+                "    Field(leaf2, 33)",
+                "    FieldSet(measure-evening)",
+                "       Field(sub_leaf1, None)",
+                "       Field(sub_leaf2, None)",
+                "       RowSet(too-wonder-option)",
+                "          FieldSet(too-wonder-option)",
+                "             Field(row_field_1, 2025-01-13)",
+                "             Field(row_field_2, 99.5)",
+                "             Field(row_calc, None)",
+                "          FieldSet(too-wonder-option)",
+                "             Field(row_field_1, 2025-01-10)",
+                "             Field(row_field_2, 23.0)",
+                "             Field(row_calc, None)",
+            ],
+        ),
+        (["nonexistent"], [" FieldSet(root)"]),
+    ],
+)
+def test_build_partial_fieldset(simple_form_structure, required_slugs, expected):
+    fieldset = structure.build_partial_fieldset(simple_form_structure, required_slugs)
+    assert structure.list_structure(fieldset) == expected
@@ -190,8 +190,8 @@ class AnswerValidator:
                 f'Invalid value "{value}". Must be of type str.', slugs=[question.slug]
             )
 
-        self._validate_dynamic_option(
-            question, document, value, user, data_source_context
+        self._validate_dynamic_options(
+            question, document, [value], user, data_source_context
         )
         self._remove_unused_dynamic_options(question, document, [value])
 
@@ -209,36 +209,38 @@ class AnswerValidator:
                     f'Invalid value: "{v}". Must be of type string',
                     slugs=[question.slug],
                 )
-            self._validate_dynamic_option(
-                question, document, v, user, data_source_context
-            )
 
+        self._validate_dynamic_options(
+            question, document, value, user, data_source_context
+        )
         self._remove_unused_dynamic_options(question, document, value)
 
-    def _validate_dynamic_option(
-        self, question, document, option, user, data_source_context
+    def _validate_dynamic_options(
+        self, question, document, options, user, data_source_context
     ):
         data_source = get_data_sources(dic=True)[question.data_source]
-        data_source_object = data_source()
-
-        valid_label = data_source_object.validate_answer_value(
-            option, document, question, user, data_source_context
+        valid_labels = data_source().validate_answer_values(
+            options, document, question, user, data_source_context
         )
-        if valid_label is False:
-            raise CustomValidationError(
-                f'Invalid value "{option}". Not a valid option.', slugs=[question.slug]
-            )
 
-        DynamicOption.objects.get_or_create(
-            document=document,
-            question=question,
-            slug=option,
-            defaults={
-                "label": valid_label,
-                "created_by_user": user.username,
-                "created_by_group": user.group,
-            },
-        )
+        for option in options:
+            valid_label = valid_labels[option]
+            if valid_label is False:
+                raise CustomValidationError(
+                    f'Invalid value "{option}". Not a valid option.',
+                    slugs=[question.slug],
+                )
+
+            DynamicOption.objects.get_or_create(
+                document=document,
+                question=question,
+                slug=option,
+                defaults={
+                    "label": valid_label,
+                    "created_by_user": user.username,
+                    "created_by_group": user.group,
+                },
+            )
 
     def _remove_unused_dynamic_options(self, question, document, used_values):
         DynamicOption.objects.filter(document=document, question=question).exclude(
@@ -383,7 +385,7 @@ class DocumentValidator:
                     document=field.answer.document,
                     question=field.question,
                     value=field.answer.value,
-                    documents=field.answer.documents.all(),
+                    documents=field._fastloader.rows_for_table_answer(field.answer.pk),
                     user=user,
                     validation_context=field,
                     data_source_context=data_source_context,